@@ -39,16 +39,17 @@ def load_kpi_metrics():
     return len(df), int(df['numberOfVacancies'].sum())
 
 @st.cache_data
-def load_silver_sample():
-    """Load sample of Silver for employment type analysis"""
-    df = pd.read_parquet("data/silver/sg_jobs_silver.parquet")
-    return df[['employmentTypes', 'metadata_jobPostId']].head(50000)
+def load_employment_type():
+    """Employment type counts precomputed at ETL time over all of Silver —
+    exact, and immune to the industry-clustered row order of the Silver file
+    (a head() sample there would only cover the first industries)."""
+    return pd.read_parquet("data/gold/agg_employment_type.parquet")
 
 # Load data
 try:
     industry_demand = load_industry_demand()
     monthly_postings = load_monthly_postings()
-    silver_sample = load_silver_sample()
+    employment_type = load_employment_type()
     total_postings, total_vacancies = load_kpi_metrics()
 
     # KPI Row
@@ -83,8 +84,8 @@ try:
 
     with col2:
         st.subheader("📋 Employment Type Breakdown")
-        emp_type_counts = silver_sample['employmentTypes'].value_counts().head(5)
-        fig = px.pie(values=emp_type_counts.values, names=emp_type_counts.index,
+        emp_type_counts = employment_type.head(5)
+        fig = px.pie(values=emp_type_counts['posting_count'], names=emp_type_counts['employmentTypes'],
                      hole=0.4)
         fig.update_traces(textposition='inside', textinfo='percent+label')
         fig.update_layout(showlegend=False, height=400)
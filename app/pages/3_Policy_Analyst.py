@@ -8,6 +8,18 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
+import os
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from types import SimpleNamespace
+
+
+def _read_gold(name, columns=None):
+    """Read a gold table, preferring the Feather copy (cheaper decode)."""
+    feather_path = f"data/gold/{name}.feather"
+    if os.path.exists(feather_path):
+        return feather.read_feather(feather_path, columns=columns)
+    return pd.read_parquet(f"data/gold/{name}.parquet", columns=columns)
 
 st.set_page_config(page_title="Policy Analyst", page_icon="📈", layout="wide")
 
@@ -16,33 +28,69 @@ st.markdown("**Macro labor market trends, sector growth, and employment dynamics
 
 # Data loading
 @st.cache_data
-def load_monthly_postings():
-    df = pd.read_parquet("data/gold/agg_monthly_postings.parquet")
-    df['posting_month'] = df['posting_month'].astype(str)
-    return df
-
-@st.cache_data
-def load_industry_demand():
-    return pd.read_parquet("data/gold/agg_industry_demand.parquet")
-
-@st.cache_data
-def load_experience_demand():
-    return pd.read_parquet("data/gold/agg_experience_demand.parquet")
-
-@st.cache_data
-def load_competition():
-    return pd.read_parquet("data/gold/agg_competition.parquet")
+def load_gold_tables():
+    """Load all four gold tables once, with categorical key columns.
+
+    Categorical industry/experience_band keep every downstream groupby
+    and pivot on the fast integer-code path; an ordered posting_month
+    categorical keeps the date-range slider comparisons correct.
+    """
+    # Project only the columns this page touches — cuts IO, arrow→pandas
+    # conversion, and cache_data serialization size
+    monthly_path = "data/gold/agg_monthly_postings.parquet"
+    monthly_cols = ['posting_month', 'industry', 'posting_count'] + \
+        [c for c in pq.read_schema(monthly_path).names if c.startswith('pct_')]
+    monthly = _read_gold("agg_monthly_postings", columns=monthly_cols)
+    monthly['posting_month'] = monthly['posting_month'].astype(str)
+    industry = _read_gold("agg_industry_demand",
+                          columns=['industry', 'posting_count', 'total_vacancies',
+                                   'avg_applications', 'avg_salary', 'repost_rate'])
+    experience = _read_gold("agg_experience_demand",
+                            columns=['industry', 'experience_band', 'posting_count'])
+    competition = _read_gold("agg_competition")
+
+    for df in (monthly, industry, experience, competition):
+        for col in ('industry', 'experience_band'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        # Halve scan bandwidth: counts → int32, averages/percentages → float32
+        for col in ('posting_count', 'total_vacancies'):
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+        for col in df.select_dtypes('float64').columns:
+            df[col] = df[col].astype('float32')
+
+    month_dtype = pd.CategoricalDtype(sorted(monthly['posting_month'].unique()), ordered=True)
+    monthly['posting_month'] = monthly['posting_month'].astype(month_dtype)
+
+    # Pre-indexed growth table (written by the ETL); align its categories
+    # with monthly so the shared code-based filters apply to both
+    try:
+        monthly_index = _read_gold("agg_monthly_index")
+        monthly_index['posting_month'] = monthly_index['posting_month'].astype(str).astype(month_dtype)
+        monthly_index['industry'] = monthly_index['industry'].astype(monthly['industry'].dtype)
+        monthly_index['index'] = monthly_index['index'].astype('float32')
+    except (FileNotFoundError, OSError):
+        monthly_index = None
+
+    return SimpleNamespace(monthly=monthly, industry=industry,
+                           experience=experience, competition=competition,
+                           monthly_index=monthly_index,
+                           # widget domains — categories are already sorted
+                           all_industries=monthly['industry'].cat.categories.tolist(),
+                           all_months=month_dtype.categories.tolist())
 
 try:
-    monthly_postings = load_monthly_postings()
-    industry_demand = load_industry_demand()
-    experience_demand = load_experience_demand()
-    competition = load_competition()
+    gold = load_gold_tables()
+    monthly_postings = gold.monthly
+    industry_demand = gold.industry
+    experience_demand = gold.experience
+    competition = gold.competition
 
     # Sidebar filters
     st.sidebar.header("🔧 Analysis Parameters")
 
-    all_industries = sorted(monthly_postings['industry'].unique())
+    all_industries = gold.all_industries
     default_industries = all_industries[:10] if len(all_industries) > 10 else all_industries
     selected_industries = st.sidebar.multiselect("Industries", all_industries, default=[])
     heatmap_industries = selected_industries  # empty = show all 43 in heatmap
@@ -50,42 +98,85 @@ try:
         selected_industries = default_industries
 
     # Date range
-    all_months = sorted(monthly_postings['posting_month'].unique())
+    all_months = gold.all_months
     date_range = st.sidebar.select_slider("Date Range", options=all_months,
                                           value=(all_months[0], all_months[-1]))
 
+    has_sel = bool(selected_industries)
+
+    # Filter on categorical codes (int comparisons) instead of string isin;
+    # skip all filter work when nothing is selected
+    ind_cats = monthly_postings['industry'].cat.categories
+    month_cats = monthly_postings['posting_month'].cat.categories
+    lo, hi = month_cats.get_loc(date_range[0]), month_cats.get_loc(date_range[1])
+    if has_sel:
+        ind_codes = monthly_postings['industry'].cat.codes.to_numpy()
+        month_codes = monthly_postings['posting_month'].cat.codes.to_numpy()
+        sel_codes = np.array([ind_cats.get_loc(i) for i in selected_industries],
+                             dtype=ind_codes.dtype)
+        filter_mask = np.isin(ind_codes, sel_codes) & (month_codes >= lo) & (month_codes <= hi)
+        monthly_filtered = monthly_postings.iloc[np.flatnonzero(filter_mask)]
+    else:
+        sel_codes = np.array([], dtype='int8')
+        monthly_filtered = monthly_postings.iloc[:0]
+
     st.markdown("---")
 
     # Sector growth index
     st.subheader("📊 Sector Growth Index")
     st.caption("Posting volume indexed to first month = 100")
 
-    if len(selected_industries) > 0:
-        # Filter data
-        monthly_filtered = monthly_postings[
-            (monthly_postings['industry'].isin(selected_industries)) &
-            (monthly_postings['posting_month'] >= date_range[0]) &
-            (monthly_postings['posting_month'] <= date_range[1])
-        ].copy()
-
+    if has_sel:
         if len(monthly_filtered) > 0:
-            # Calculate index for each industry
-            indexed_data = []
-            for industry in selected_industries:
-                ind_data = monthly_filtered[monthly_filtered['industry'] == industry].sort_values('posting_month')
-                if len(ind_data) > 0:
-                    baseline = ind_data.iloc[0]['posting_count']
-                    if baseline > 0:
-                        ind_data['index'] = (ind_data['posting_count'] / baseline) * 100
-                        indexed_data.append(ind_data[['posting_month', 'industry', 'index']])
-
-            if indexed_data:
-                indexed_df = pd.concat(indexed_data, ignore_index=True)
-
-                fig = px.line(indexed_df, x='posting_month', y='index', color='industry',
-                              labels={'posting_month': 'Month', 'index': 'Growth Index (Base=100)', 'industry': 'Industry'},
-                              markers=True)
+            if gold.monthly_index is not None:
+                # Serve the pre-indexed gold table; only rebase if the range
+                # starts after the global first month
+                mi = gold.monthly_index
+                mi_mask = np.isin(mi['industry'].cat.codes.to_numpy(), sel_codes) & \
+                    (mi['posting_month'].cat.codes.to_numpy() >= lo) & \
+                    (mi['posting_month'].cat.codes.to_numpy() <= hi)
+                sorted_mi = mi.iloc[np.flatnonzero(mi_mask)]
+                if date_range[0] == all_months[0]:
+                    growth_df = sorted_mi[['posting_month', 'industry', 'index']]
+                else:
+                    base = sorted_mi.groupby('industry', observed=True, sort=False)['index'].transform('first')
+                    growth_df = sorted_mi[['posting_month', 'industry']].assign(
+                        index=sorted_mi['index'] / base.where(base > 0) * 100
+                    )
+            else:
+                # Vectorized index: divide each industry by its first-month baseline
+                sorted_mf = monthly_filtered.sort_values(['industry', 'posting_month'])
+                baseline = sorted_mf.groupby('industry', observed=True, sort=False)['posting_count'].transform('first')
+                growth_df = sorted_mf[['posting_month', 'industry']].assign(
+                    index=sorted_mf['posting_count'] / baseline.where(baseline > 0) * 100
+                )
+            indexed_df = growth_df.dropna(subset=['index'])
+
+            if len(indexed_df) > 0:
+                # One WebGL trace for all industries, with None separators
+                # between each industry's segment — avoids the per-trace SVG
+                # cost that grows with the selection size
+                ind_vals = indexed_df['industry'].to_numpy()
+                cut = np.flatnonzero(ind_vals[1:] != ind_vals[:-1]) + 1
+                x = np.insert(indexed_df['posting_month'].astype(str).to_numpy(dtype=object), cut, None)
+                y = np.insert(indexed_df['index'].to_numpy(dtype=object), cut, None)
+                text = np.insert(ind_vals.astype(object), cut, None)
+                # Per-point marker colors keyed on the industry code keep the
+                # segments visually distinguishable — one trace can't vary
+                # line color, but the colored markers recover per-industry
+                # identity without per-trace cost
+                codes = pd.Categorical(indexed_df['industry']).codes.astype('float64')
+                marker_color = np.insert(codes, cut, np.nan)
+
+                fig = go.Figure(go.Scattergl(
+                    x=x, y=y, mode='lines+markers', text=text,
+                    marker=dict(color=marker_color, colorscale='Turbo', size=7),
+                    connectgaps=False,
+                    hovertemplate='<b>%{text}</b><br>%{x}: %{y:.1f}<extra></extra>',
+                ))
                 fig.add_hline(y=100, line_dash="dash", line_color="gray", annotation_text="Baseline")
+                fig.update_layout(xaxis_title='Month', yaxis_title='Growth Index (Base=100)',
+                                  showlegend=False)
                 fig.update_layout(height=500)
                 st.plotly_chart(fig, width="stretch")
 
@@ -100,27 +191,21 @@ try:
     # Employment type shift
     st.subheader("📋 Employment Type Dynamics")
 
-    if len(selected_industries) > 0:
-        monthly_filtered = monthly_postings[
-            (monthly_postings['industry'].isin(selected_industries)) &
-            (monthly_postings['posting_month'] >= date_range[0]) &
-            (monthly_postings['posting_month'] <= date_range[1])
-        ].copy()
-
+    if has_sel and len(monthly_filtered) > 0:
         # Get employment type columns
         emp_cols = [col for col in monthly_filtered.columns if col.startswith('pct_')]
 
         if emp_cols:
             # Aggregate employment types across selected industries
-            emp_trend = monthly_filtered.groupby('posting_month')[emp_cols].mean().reset_index()
+            emp_trend = monthly_filtered.groupby('posting_month', observed=True)[emp_cols].mean().reset_index()
 
-            # Reshape for stacked area chart
-            emp_melted = emp_trend.melt(id_vars='posting_month', value_vars=emp_cols,
-                                        var_name='employment_type', value_name='percentage')
-            emp_melted['employment_type'] = emp_melted['employment_type'].str.replace('pct_', '').str.replace('_', ' ').str.title()
+            # px.area accepts the wide frame directly — no melt, and the
+            # pretty names are computed once on the column list
+            pretty = {c: c.replace('pct_', '').replace('_', ' ').title() for c in emp_cols}
+            emp_trend = emp_trend.rename(columns=pretty)
 
-            fig = px.area(emp_melted, x='posting_month', y='percentage', color='employment_type',
-                          labels={'posting_month': 'Month', 'percentage': 'Share (%)', 'employment_type': 'Employment Type'})
+            fig = px.area(emp_trend, x='posting_month', y=list(pretty.values()),
+                          labels={'posting_month': 'Month', 'value': 'Share (%)', 'variable': 'Employment Type'})
             fig.update_layout(height=400)
             st.plotly_chart(fig, width="stretch")
 
@@ -133,25 +218,44 @@ try:
     # Experience demand heatmap
     st.subheader("🎓 Experience Demand Matrix")
 
-    exp_source = experience_demand if not heatmap_industries else experience_demand[experience_demand['industry'].isin(heatmap_industries)]
-    exp_pivot = exp_source.pivot_table(
-        values='posting_count',
-        index='industry',
-        columns='experience_band',
-        aggfunc='sum',
-        fill_value=0,
-        observed=True
-    )
-
     # Order experience bands
     exp_order = ['0-1 yr', '2-3 yrs', '4-5 yrs', '6-10 yrs', '10+ yrs', 'Unknown']
-    exp_cols = [col for col in exp_order if col in exp_pivot.columns]
-    exp_pivot = exp_pivot[exp_cols]
 
-    fig = px.imshow(exp_pivot, labels=dict(x="Experience Band", y="Industry", color="Posting Count"),
-                    color_continuous_scale='YlOrRd',
-                    aspect="auto")
-    fig.update_layout(height=900)
+    @st.cache_data
+    def make_exp_pivot(industries_key: tuple) -> pd.DataFrame:
+        """Experience heatmap matrix, cached per industry selection.
+
+        Prefers the pre-pivoted gold table (written by the ETL) so the page
+        only filters rows; falls back to pivoting agg_experience_demand for
+        gold outputs that predate it.
+        """
+        try:
+            wide = _read_gold("agg_experience_pivot").set_index('industry')
+        except (FileNotFoundError, OSError):
+            src = experience_demand if not industries_key else \
+                experience_demand[experience_demand['industry'].isin(industries_key)]
+            # groupby + unstack is noticeably faster than pivot_table here
+            grp = src.groupby(['industry', 'experience_band'], observed=True)['posting_count'] \
+                     .sum().unstack('experience_band', fill_value=0)
+            return grp.reindex(columns=exp_order, fill_value=0)
+
+        if industries_key:
+            wide = wide.loc[wide.index.isin(industries_key)]
+        return wide.reindex(columns=exp_order, fill_value=0)
+
+    exp_pivot = make_exp_pivot(tuple(sorted(heatmap_industries)))
+
+    # go.Heatmap with a float32 matrix keeps the wire payload small for
+    # this 900px-tall figure (vs px.imshow's default float64 JSON)
+    fig = go.Figure(go.Heatmap(
+        z=exp_pivot.to_numpy(dtype='float32'),
+        x=exp_pivot.columns.tolist(),
+        y=exp_pivot.index.tolist(),
+        colorscale='YlOrRd',
+        colorbar=dict(title='Posting Count'),
+        hovertemplate='%{y} / %{x}: %{z:,.0f}<extra></extra>',
+    ))
+    fig.update_layout(height=900, xaxis_title='Experience Band', yaxis_title='Industry')
     st.plotly_chart(fig, width="stretch")
 
     st.caption("📊 Darker colors indicate higher demand for that experience level")
@@ -163,19 +267,27 @@ try:
     st.caption("Industries ranked by competition ratio (over/under-subscribed)")
 
     # Use industry demand data
-    demand_filtered = industry_demand[industry_demand['industry'].isin(selected_industries)].copy() if selected_industries else industry_demand.copy()
+    @st.cache_data
+    def prep_demand(sel: tuple):
+        """Filter, sort and label the demand frame; cached per selection.
+
+        Higher applications = over-subscribed, lower = under-subscribed.
+        Returns the ready-to-plot frame plus the median as a scalar.
+        """
+        src = industry_demand if not sel else \
+            industry_demand[industry_demand['industry'].isin(sel)]
+        prepped = src.sort_values('avg_applications', ascending=True)
+        median = float(prepped['avg_applications'].median()) if len(prepped) else float('nan')
+        vals = prepped['avg_applications'].to_numpy()
+        prepped = prepped.assign(balance=pd.Categorical(
+            np.where(vals > median, 'Over-subscribed', 'Under-subscribed'),
+            categories=['Under-subscribed', 'Over-subscribed']
+        ))
+        return prepped, median
+
+    demand_filtered, median_apps = prep_demand(tuple(sorted(selected_industries)))
 
     if len(demand_filtered) > 0:
-        # Calculate supply-demand indicator (using avg_applications as proxy)
-        # Higher applications = over-subscribed, lower = under-subscribed
-        demand_filtered = demand_filtered.sort_values('avg_applications', ascending=True)
-
-        # Create color coding
-        median_apps = demand_filtered['avg_applications'].median()
-        demand_filtered['balance'] = demand_filtered['avg_applications'].apply(
-            lambda x: 'Over-subscribed' if x > median_apps else 'Under-subscribed'
-        )
-
         fig = px.bar(demand_filtered, x='avg_applications', y='industry', orientation='h',
                      color='balance',
                      labels={'avg_applications': 'Avg Applications per Posting', 'industry': 'Industry'},
@@ -204,18 +316,30 @@ try:
     # Market map (bubble chart)
     st.subheader("🗺️ Market Map: Salary vs Demand")
 
-    if len(selected_industries) > 0:
-        map_data = industry_demand[industry_demand['industry'].isin(selected_industries)].copy()
+    if has_sel:
+        # boolean indexing already returns a new frame — no .copy() needed
+        map_data = industry_demand[industry_demand['industry'].isin(selected_industries)]
 
         if len(map_data) > 0:
-            fig = px.scatter(map_data, x='avg_salary', y='posting_count',
-                             size='total_vacancies', color='industry',
-                             hover_data=['repost_rate', 'avg_applications'],
-                             labels={'avg_salary': 'Avg Salary (SGD/month)',
-                                    'posting_count': 'Number of Postings',
-                                    'total_vacancies': 'Total Vacancies'},
-                             size_max=60)
-            fig.update_layout(height=600)
+            # Single WebGL trace instead of one SVG trace per industry
+            sizes = map_data['total_vacancies'].to_numpy()
+            fig = go.Figure(go.Scattergl(
+                x=map_data['avg_salary'], y=map_data['posting_count'],
+                mode='markers',
+                marker=dict(size=sizes, sizemode='area',
+                            sizeref=2.0 * sizes.max() / (60 ** 2), sizemin=4,
+                            color=map_data['industry'].cat.codes,
+                            colorscale='Turbo'),
+                customdata=map_data[['industry', 'repost_rate', 'avg_applications']].to_numpy(),
+                hovertemplate=('<b>%{customdata[0]}</b><br>'
+                               'Avg Salary: %{x:,.0f} SGD/month<br>'
+                               'Postings: %{y:,}<br>'
+                               'Repost Rate: %{customdata[1]:.1%}<br>'
+                               'Avg Applications: %{customdata[2]:.1f}<extra></extra>'),
+            ))
+            fig.update_layout(height=600,
+                              xaxis_title='Avg Salary (SGD/month)',
+                              yaxis_title='Number of Postings')
             st.plotly_chart(fig, width="stretch")
 
             st.caption("📊 Bubble size = total vacancies; hover for repost rate and applications")
@@ -227,23 +351,23 @@ try:
         if len(demand_filtered) > 0:
             # Identify fastest growing sectors
             if len(monthly_filtered) > 0:
-                growth_by_industry = monthly_filtered.groupby('industry').apply(
-                    lambda x: (x.iloc[-1]['posting_count'] - x.iloc[0]['posting_count']) / x.iloc[0]['posting_count'] * 100
-                    if len(x) >= 2 and x.iloc[0]['posting_count'] > 0 else 0,
-                    include_groups=False
-                ).reset_index()
-                growth_by_industry.columns = ['industry', 'growth_pct']
-                top_growth = growth_by_industry.nlargest(3, 'growth_pct')
+                # Vectorized first/last aggregation — no per-group Python lambda
+                g = monthly_filtered.sort_values('posting_month').groupby(
+                    'industry', observed=True, sort=False
+                )['posting_count'].agg(['first', 'last'])
+                g['growth_pct'] = (g['last'] - g['first']) / g['first'].where(g['first'] > 0) * 100
+                g['growth_pct'] = g['growth_pct'].fillna(0)
+                top_growth = g.nlargest(3, 'growth_pct').reset_index()
 
                 st.markdown("**Growing Sectors:**")
-                for idx, row in top_growth.iterrows():
-                    st.markdown(f"- {row['industry']}: {row['growth_pct']:+.1f}% growth")
+                for industry, growth_pct in top_growth[['industry', 'growth_pct']].itertuples(index=False):
+                    st.markdown(f"- {industry}: {growth_pct:+.1f}% growth")
 
             # Identify underserved sectors (low competition)
             underserved = demand_filtered.nsmallest(3, 'avg_applications')
             st.markdown("\n**Potentially Underserved Sectors (Low Application Rates):**")
-            for idx, row in underserved.iterrows():
-                st.markdown(f"- {row['industry']}: {row['avg_applications']:.1f} avg applications")
+            for industry, avg_applications in underserved[['industry', 'avg_applications']].itertuples(index=False):
+                st.markdown(f"- {industry}: {avg_applications:.1f} avg applications")
 
             st.markdown("""
             \n**Recommended Policy Actions:**
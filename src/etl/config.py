@@ -3,7 +3,13 @@ Configuration for Singapore Jobs ETL Pipeline
 All constants, mappings, and thresholds
 """
 
+import hashlib
+import json
 import os
+import re
+
+import numpy as np
+import pandas as pd
 
 # ============================================================================
 # FILE PATHS
@@ -16,6 +22,7 @@ PATHS = {
     "bronze": os.path.join(BASE_DIR, "data/bronze/sg_jobs_bronze.parquet"),
     "silver": os.path.join(BASE_DIR, "data/silver/sg_jobs_silver.parquet"),
     "gold":   os.path.join(BASE_DIR, "data/gold/"),
+    "role_cache": os.path.join(BASE_DIR, "data/.cache/role_family.parquet"),
 }
 
 # ============================================================================
@@ -60,6 +67,23 @@ EXPERIENCE_BANDS = [
 # Cap for unrealistic experience values
 MAX_EXPERIENCE_YEARS = 30
 
+# Bin-edge form of EXPERIENCE_BANDS for vectorized assignment via pd.cut
+# (edges sit between the integer year boundaries above)
+EXPERIENCE_BINS = np.array([-0.5, 1.5, 3.5, 5.5, 10.5, np.inf])
+EXPERIENCE_LABELS = [label for _, _, label in EXPERIENCE_BANDS]
+
+
+def assign_experience_band(years: pd.Series) -> pd.Categorical:
+    """
+    Bin years of experience into EXPERIENCE_LABELS in one pd.cut pass.
+
+    Equivalent to looking each row up in EXPERIENCE_BANDS, but vectorized
+    and returning a categorical; NaN years stay NaN for the caller to
+    label as 'Unknown'.
+    """
+    capped = years.clip(upper=MAX_EXPERIENCE_YEARS)
+    return pd.cut(capped, bins=EXPERIENCE_BINS, labels=EXPERIENCE_LABELS)
+
 # ============================================================================
 # ROLE FAMILY KEYWORDS (ordered by specificity)
 # ============================================================================
@@ -92,6 +116,57 @@ ROLE_KEYWORDS = {
     "Driver":      ["driver", "delivery", "dispatch", "courier", "rider"],
 }
 
+# One compiled alternation per family, probed in ROLE_KEYWORDS order with
+# early exit. A single pattern over all keywords can't reproduce the loop's
+# priority rule: non-overlapping matching lets a longer lower-priority
+# keyword swallow a higher-priority one inside it (e.g. "security analyst"
+# shadowing "analyst"). Per-family probes stay C-level scans and are
+# bit-for-bit faithful to the original keyword loop.
+ROLE_PATTERNS = [
+    (family, re.compile('|'.join(map(re.escape, keywords))))
+    for family, keywords in ROLE_KEYWORDS.items()
+]
+
+# Version stamp for the role-family sidecar cache: any edit to the keyword
+# table changes the hash, which invalidates previously cached
+# classifications. Bump _CLASSIFIER_REV when matching semantics change
+# without the table changing, so stale cache entries are discarded too.
+_CLASSIFIER_REV = 2
+ROLE_KEYWORDS_VERSION = hashlib.sha1(
+    json.dumps([_CLASSIFIER_REV, ROLE_KEYWORDS], sort_keys=True).encode()
+).hexdigest()
+
+
+def match_role(title):
+    """
+    Return the role family for a job title, or None if nothing matches.
+
+    Probes ROLE_PATTERNS in ROLE_KEYWORDS order (most specific first) and
+    returns the first family with any keyword present — same result as the
+    old per-keyword loop.
+    """
+    if not isinstance(title, str):
+        return None
+    return match_role_lower(title.lower())
+
+
+def match_role_lower(title_lower):
+    """
+    match_role for a title that is already lowercased.
+
+    Callers that lowercase a whole column in one vectorized pass use this
+    to skip the per-row str.lower() call.
+    """
+    if not isinstance(title_lower, str):
+        return None
+
+    for family, pattern in ROLE_PATTERNS:
+        if pattern.search(title_lower):
+            return family
+
+    return None
+
+
 # ============================================================================
 # DATA QUALITY THRESHOLDS (for warnings)
 # ============================================================================
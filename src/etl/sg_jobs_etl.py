@@ -6,12 +6,51 @@ Medallion Architecture: Bronze → Silver → Gold
 import os
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 from typing import Dict, Optional
 from src.etl import config
 
 
+def _parquet_num_rows(path: str) -> int:
+    """
+    Row count from the parquet footer — no data pages are decoded.
+
+    Unreadable files (missing, truncated, or not actually parquet) count
+    as 0 rows so a summary over a partial data directory still prints.
+    """
+    try:
+        # num_rows is a file-level FileMetaData field: the count never
+        # touches per-row-group column statistics, whose footer share grows
+        # with column count. Keep it that way if gold tables get wider —
+        # don't replace this with anything that walks row_group(i) entries.
+        return pq.read_metadata(path).num_rows
+    except (OSError, pa.ArrowInvalid):
+        print(f"⚠️  Could not read parquet footer: {path}")
+        return 0
+
+
+@lru_cache(maxsize=128)
+def _cached_num_rows(path: str, mtime_ns: int, size: int) -> int:
+    """
+    Memoized footer row count — mtime_ns/size are only part of the cache
+    key, so a rewritten file invalidates its entry automatically.
+    """
+    return _parquet_num_rows(path)
+
+
+def _stat_num_rows(path: str) -> int:
+    """Stat the file once and look its row count up in the footer cache."""
+    st = os.stat(path)
+    return _cached_num_rows(path, st.st_mtime_ns, st.st_size)
+
+
 class SGJobsETL:
     """
     Medallion Architecture ETL Pipeline for Singapore Jobs Data
@@ -19,7 +58,7 @@ class SGJobsETL:
     Layers:
         - Bronze: Raw data cleaning (remove synthetic, nulls, bad cols)
         - Silver: Feature engineering (categories, seniority, salary, roles)
-        - Gold: Business aggregates (6 tables for dashboard)
+        - Gold: Business aggregates (9 tables for dashboard)
 
     Usage:
         etl = SGJobsETL()
@@ -31,6 +70,56 @@ class SGJobsETL:
         gold_tables = etl.run_gold()
     """
 
+    # Shared parquet write options: zstd level 3 compresses ~30% tighter than
+    # snappy at near-identical read speed, dictionary encoding shrinks the
+    # repetitive string columns, and 200k-row groups keep predicate-pushdown
+    # reads from dragging in the whole file
+    _PARQUET_WRITE_OPTS = {
+        'engine': 'pyarrow',
+        'compression': 'zstd',
+        'compression_level': 3,
+        'row_group_size': 200_000,
+        'use_dictionary': True,
+        'index': False,
+    }
+
+    # Bronze columns the Silver transforms actually reference — everything
+    # else is projected away at the top of run_silver so feature engineering
+    # never carries dead columns through memory or the Silver parquet
+    _SILVER_KEEP = {
+        'title', 'categories', 'positionLevels',
+        'salary_minimum', 'salary_maximum',
+        'metadata_newPostingDate', 'metadata_expiryDate',
+        'minimumYearsExperience', 'metadata_totalNumberJobApplication',
+        'numberOfVacancies', 'metadata_repostCount', 'metadata_jobPostId',
+        'postedCompany_name', 'employmentTypes', 'metadata_totalNumberOfView',
+    }
+
+    # Primary query dimension per Gold table — each table is sorted on
+    # these keys before writing so min/max statistics cluster and filtered
+    # reads can skip row groups
+    _GOLD_SORT_KEYS = {
+        'agg_monthly_postings': ['industry', 'posting_month'],
+        'agg_monthly_index': ['industry', 'posting_month'],
+        'agg_salary_by_role': ['role_family', 'seniority_tier', 'industry'],
+        'agg_industry_demand': ['industry'],
+        'agg_competition': ['industry', 'role_family'],
+        'agg_top_companies': ['primary_industry', 'company'],
+        'agg_experience_demand': ['industry', 'experience_band'],
+        'agg_experience_pivot': ['industry'],
+    }
+
+    # Column superset the Gold aggregators need from Silver — everything the
+    # exploded frame carries plus the company/primary-industry grain columns
+    _GOLD_INPUT_COLS = [
+        'posting_month', 'industry_list', 'employmentTypes',
+        'metadata_jobPostId', 'numberOfVacancies', 'average_salary_clean',
+        'metadata_totalNumberJobApplication', 'metadata_totalNumberOfView',
+        'is_reposted', 'competition_ratio', 'role_family',
+        'experience_band', 'seniority_tier',
+        'postedCompany_name', 'primary_industry',
+    ]
+
     def __init__(self, config_override: Optional[Dict] = None, strict_mode: bool = False):
         """
         Initialize ETL pipeline
@@ -60,6 +149,11 @@ class SGJobsETL:
 
         self.strict_mode = strict_mode
 
+        # Copy-on-Write lets the filter/drop helpers return frames without
+        # defensive .copy() calls; always enabled from pandas 3.0
+        if int(pd.__version__.split('.')[0]) < 3:
+            pd.set_option('mode.copy_on_write', True)
+
     # ========================================================================
     # BRONZE LAYER
     # ========================================================================
@@ -88,7 +182,7 @@ class SGJobsETL:
         return df
 
     def _load_raw(self) -> pd.DataFrame:
-        """Load raw CSV with explicit dtypes"""
+        """Load raw CSV with explicit dtypes (Arrow parser + parquet cache)"""
         print("[Bronze] Loading raw CSV...")
 
         raw_path = self.config['PATHS']['raw']
@@ -111,7 +205,22 @@ class SGJobsETL:
             'average_salary': 'float64',
         }
 
-        df = pd.read_csv(raw_path, dtype=dtype_dict, low_memory=False)
+        # First run converts the CSV to parquet next to it; later runs read
+        # the parquet (column-pruned, compressed) instead of re-parsing CSV
+        cache_path = os.path.splitext(raw_path)[0] + '.parquet'
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(raw_path):
+            df = pd.read_parquet(cache_path)
+            print(f"[Bronze]   Loaded {len(df):,} rows × {len(df.columns)} columns (parquet cache)")
+            return df
+
+        # engine='pyarrow' uses Arrow's multi-threaded C++ CSV tokenizer
+        df = pd.read_csv(raw_path, dtype=dtype_dict, engine='pyarrow')
+
+        try:
+            df.to_parquet(cache_path, compression='snappy', index=False)
+            print(f"[Bronze]   Cached raw data to: {cache_path}")
+        except OSError as e:
+            print(f"[Bronze]   ⚠️  Could not cache raw parquet: {e}")
 
         print(f"[Bronze]   Loaded {len(df):,} rows × {len(df.columns)} columns")
         print(f"[Bronze]   File size: {os.path.getsize(raw_path) / 1024**2:.1f} MB")
@@ -131,12 +240,13 @@ class SGJobsETL:
         synthetic_df = df[synthetic_mask]
 
         if len(synthetic_df) > 0:
-            # Validation: check if these rows have anomalous salaries
-            max_salary = synthetic_df[['salary_minimum', 'salary_maximum']].max().max()
-            high_salary_count = (
-                (synthetic_df['salary_minimum'] > 100_000) |
-                (synthetic_df['salary_maximum'] > 100_000)
-            ).sum()
+            # Validation: check if these rows have anomalous salaries —
+            # both stats come from one materialized array instead of
+            # separate column scans
+            sal = synthetic_df[['salary_minimum', 'salary_maximum']].to_numpy(
+                dtype='float64', na_value=np.nan)
+            max_salary = np.nanmax(sal) if np.isfinite(sal).any() else np.nan
+            high_salary_count = int((sal > 100_000).any(axis=1).sum())
 
             print(f"[Bronze]   Found {len(synthetic_df):,} RANDOM_JOB_ rows")
             print(f"[Bronze]   Max salary in filtered rows: ${max_salary:,.0f}/month")
@@ -152,7 +262,7 @@ class SGJobsETL:
                 if self.strict_mode:
                     raise ValueError("Synthetic rows validation failed - salaries appear normal")
 
-        df_clean = df[~synthetic_mask].copy()
+        df_clean = df[~synthetic_mask]
         removed_count = initial_count - len(df_clean)
 
         print(f"[Bronze]   Removed {removed_count:,} synthetic rows")
@@ -166,7 +276,7 @@ class SGJobsETL:
         initial_count = len(df)
 
         # Drop rows where title is null (primary indicator of row-wide nulls)
-        df_clean = df[df['title'].notna()].copy()
+        df_clean = df[df['title'].notna()]
 
         removed_count = initial_count - len(df_clean)
         print(f"[Bronze]   Removed {removed_count:,} null rows")
@@ -189,7 +299,7 @@ class SGJobsETL:
             df_clean = df.drop(columns=cols_to_drop)
             print(f"[Bronze]   Dropped {len(cols_to_drop)} columns: {', '.join(cols_to_drop)}")
         else:
-            df_clean = df.copy()
+            df_clean = df
             print(f"[Bronze]   No useless columns found")
 
         return df_clean
@@ -208,6 +318,18 @@ class SGJobsETL:
 
         print(f"[Bronze]   Parsed {parsed_count} date columns")
 
+        # Arrow-backed strings: one packed buffer + offsets instead of a
+        # PyObject per row — .str kernels and isna run in Arrow C++
+        string_cols = ['title', 'categories', 'postedCompany_name',
+                       'employmentTypes', 'positionLevels', 'metadata_jobPostId']
+        converted = 0
+        for col in string_cols:
+            if col in df.columns:
+                df[col] = df[col].astype('string[pyarrow]')
+                converted += 1
+
+        print(f"[Bronze]   Converted {converted} columns to Arrow-backed strings")
+
         return df
 
     def _save_bronze(self, df: pd.DataFrame) -> None:
@@ -217,7 +339,12 @@ class SGJobsETL:
         bronze_path = self.config['PATHS']['bronze']
         os.makedirs(os.path.dirname(bronze_path), exist_ok=True)
 
-        df.to_parquet(bronze_path, compression='snappy', index=False)
+        # Bronze gets smaller row groups plus column statistics so selective
+        # downstream reads (filters= / column projections) can skip row
+        # groups instead of scanning the whole file
+        df.to_parquet(bronze_path, **{**self._PARQUET_WRITE_OPTS,
+                                      'row_group_size': 100_000,
+                                      'write_statistics': True})
 
         file_size = os.path.getsize(bronze_path) / 1024**2
         print(f"[Bronze]   Saved to: {bronze_path}")
@@ -238,12 +365,41 @@ class SGJobsETL:
         print("SILVER LAYER: Feature Engineering")
         print("="*70)
 
-        df = self.load_bronze()
-        df = self._parse_categories(df)
-        df = self._map_seniority(df)
-        df = self._clean_salary(df)
-        df = self._parse_dates(df)
-        df = self._extract_role_family(df)
+        # Push the Silver working-set projection down into the parquet
+        # reader — the unused Bronze columns are never decoded at all
+        bronze_path = self.config['PATHS']['bronze']
+        columns = None
+        if os.path.exists(bronze_path):
+            columns = [c for c in pq.read_schema(bronze_path).names
+                       if c in self._SILVER_KEEP]
+        df = self.load_bronze(columns=columns)
+        print(f"[Silver] Loaded {len(df.columns)} Bronze columns (projection pushdown)")
+
+        # Wave 1: these transforms read and write disjoint column sets, so
+        # each runs on its own slice of the frame in a thread pool (the
+        # heavy kernels underneath — Arrow strings, NumPy, regex scans over
+        # C buffers — release the GIL). Helpers keep their (df) -> df
+        # signatures, so the unit tests still call them directly.
+        wave = [
+            (self._parse_categories, ['categories']),
+            (self._map_seniority, ['positionLevels']),
+            (self._clean_salary, ['salary_minimum', 'salary_maximum']),
+            (self._parse_dates, ['metadata_newPostingDate', 'metadata_expiryDate']),
+            (self._extract_role_family, ['title']),
+        ]
+        with ThreadPoolExecutor(max_workers=len(wave)) as pool:
+            futures = [pool.submit(fn, df[cols]) for fn, cols in wave]
+            results = [future.result() for future in futures]
+
+        # Stitch the transformed slices back around the untouched columns
+        consumed = {c for _, cols in wave for c in cols}
+        df = pd.concat(
+            [df[[c for c in df.columns if c not in consumed]]] + results,
+            axis=1,
+        )
+
+        # Wave 2: derived features consume wave-1 outputs (cleaned salary,
+        # parsed categories), so they run after the merge
         df = self._add_derived_features(df)
         df = self._optimize_dtypes(df)
         self._save_silver(df)
@@ -264,27 +420,23 @@ class SGJobsETL:
         """
         print("[Silver] Parsing categories (JSON → industries)...")
 
-        def parse_category(cat_string):
-            if pd.isna(cat_string):
-                return []
-
-            try:
-                # Parse JSON array of objects
-                categories = json.loads(cat_string)
-                # Extract "category" field from each object
-                if isinstance(categories, list):
-                    return [item.get('category', '') for item in categories if isinstance(item, dict)]
-                return []
-            except:
-                # Fallback: regex extraction for category field
-                matches = re.findall(r'"category":"([^"]+)"', str(cat_string))
-                return matches if matches else []
-
-        df['industry_list'] = df['categories'].apply(parse_category)
-        df['primary_industry'] = df['industry_list'].apply(
-            lambda x: x[0] if len(x) > 0 else 'Unknown'
-        )
-        df['industry_count'] = df['industry_list'].apply(len)
+        # One vectorized regex pass over the whole column instead of
+        # json.loads per row — the JSON shape is fixed, so extracting the
+        # "category" values directly is equivalent (and was already the
+        # fallback for malformed rows)
+        extracted = df['categories'].fillna('').astype(str).str.extractall(r'"category":"([^"]+)"')[0]
+        grouped = extracted.groupby(level=0)
+        lengths = grouped.size().reindex(df.index, fill_value=0).to_numpy()
+
+        # Store industry_list as an Arrow ListArray (flat values + offsets)
+        # instead of a Python list per row — ~10x smaller and explode stays
+        # out of Python-object land. extractall preserves row order, so the
+        # flat values line up with the cumulative lengths.
+        offsets = np.concatenate(([0], np.cumsum(lengths))).astype('int32')
+        list_arr = pa.ListArray.from_arrays(offsets, pa.array(extracted, type=pa.string()))
+        df['industry_list'] = pd.arrays.ArrowExtensionArray(list_arr)
+        df['primary_industry'] = grouped.first().reindex(df.index, fill_value='Unknown')
+        df['industry_count'] = pd.Series(lengths, index=df.index, dtype='int32')
 
         unique_industries = df['primary_industry'].nunique()
         print(f"[Silver]   Parsed {unique_industries} unique industries")
@@ -301,10 +453,16 @@ class SGJobsETL:
         print("[Silver] Mapping seniority levels (9 → 4 tiers)...")
 
         seniority_map = self.config['SENIORITY_MAP']
-        df['seniority_tier'] = df['positionLevels'].map(seniority_map)
 
-        # Fill unmapped with "Unknown"
-        df['seniority_tier'] = df['seniority_tier'].fillna('Unknown')
+        # Map on the category dictionary (≤9 entries) instead of N rows:
+        # one gather through the codes array, with code -1 (NaN) landing on
+        # the trailing 'Unknown'
+        cat = df['positionLevels'].astype('category')
+        tier_for_code = np.array(
+            [seniority_map.get(level, 'Unknown') for level in cat.cat.categories] + ['Unknown'],
+            dtype=object,
+        )
+        df['seniority_tier'] = pd.Categorical(tier_for_code[cat.cat.codes])
 
         tier_counts = df['seniority_tier'].value_counts()
         print(f"[Silver]   Seniority distribution:")
@@ -327,43 +485,48 @@ class SGJobsETL:
         df['salary_minimum_raw'] = df['salary_minimum'].astype('float32')
         df['salary_maximum_raw'] = df['salary_maximum'].astype('float32')
 
-        # Stage 1: Hard bounds
+        # All three stages run as one fused NumPy kernel on the raw arrays —
+        # same math as the old column-at-a-time version, ~4x less memory
+        # traffic (each array is read/written once instead of per stage)
         floor = self.config['SALARY_FLOOR']
         ceiling = self.config['SALARY_CEILING']
 
-        df.loc[df['salary_minimum'] < floor, 'salary_minimum'] = np.nan
-        df.loc[df['salary_maximum'] < floor, 'salary_maximum'] = np.nan
-        df.loc[df['salary_minimum'] > ceiling, 'salary_minimum'] = np.nan
-        df.loc[df['salary_maximum'] > ceiling, 'salary_maximum'] = np.nan
+        mn = df['salary_minimum'].to_numpy(dtype='float64', na_value=np.nan, copy=True)
+        mx = df['salary_maximum'].to_numpy(dtype='float64', na_value=np.nan, copy=True)
 
-        # Fix inverted min/max
-        swap_mask = (df['salary_minimum'] > df['salary_maximum']) & \
-                    df['salary_minimum'].notna() & df['salary_maximum'].notna()
-        df.loc[swap_mask, ['salary_minimum', 'salary_maximum']] = \
-            df.loc[swap_mask, ['salary_maximum', 'salary_minimum']].values
+        # Stage 1: Hard bounds
+        mn = np.where((mn < floor) | (mn > ceiling), np.nan, mn)
+        mx = np.where((mx < floor) | (mx > ceiling), np.nan, mx)
+
+        # Fix inverted min/max (NaN comparisons are False, so the swap is
+        # branchless and NaN-safe)
+        swap = mn > mx
+        mn, mx = np.where(swap, mx, mn), np.where(swap, mn, mx)
 
-        removed_count = df['salary_minimum'].isna().sum()
+        df['salary_minimum'] = mn
+        df['salary_maximum'] = mx
+
+        # Count from the array still in cache, not a fresh column scan
+        removed_count = int(np.isnan(mn).sum())
         print(f"[Silver]   Removed {removed_count:,} salaries outside [${floor} - ${ceiling:,}]")
 
         # Stage 2: IQR outlier flagging
         print("[Silver] Stage 2/3: Flagging IQR outliers...")
 
-        df['average_salary_temp'] = (df['salary_minimum'] + df['salary_maximum']) / 2
-        valid_salaries = df['average_salary_temp'].dropna()
+        avg = (mn + mx) * 0.5
+        has_valid = bool(np.isfinite(avg).any())
 
-        if len(valid_salaries) > 0:
-            Q1 = valid_salaries.quantile(0.25)
-            Q3 = valid_salaries.quantile(0.75)
+        if has_valid:
+            p01, p99 = self.config['WINSOR_PERCENTILES']
+            # One pass for all four quantiles
+            Q1, Q3, p01_val, p99_val = np.nanquantile(avg, [0.25, 0.75, p01, p99])
             IQR = Q3 - Q1
 
             iqr_mult = self.config['IQR_MULTIPLIER']
             lower_fence = Q1 - iqr_mult * IQR
             upper_fence = Q3 + iqr_mult * IQR
 
-            df['salary_outlier_iqr'] = (
-                (df['average_salary_temp'] < lower_fence) |
-                (df['average_salary_temp'] > upper_fence)
-            )
+            df['salary_outlier_iqr'] = (avg < lower_fence) | (avg > upper_fence)
 
             outlier_count = df['salary_outlier_iqr'].sum()
             print(f"[Silver]   Flagged {outlier_count:,} IQR outliers (not removed)")
@@ -375,25 +538,21 @@ class SGJobsETL:
         # Stage 3: Winsorization
         print("[Silver] Stage 3/3: Winsorizing at 1st/99th percentile...")
 
-        if len(valid_salaries) > 0:
-            p01, p99 = self.config['WINSOR_PERCENTILES']
-            p01_val = valid_salaries.quantile(p01)
-            p99_val = valid_salaries.quantile(p99)
+        if has_valid:
+            mn_clean = np.clip(mn, p01_val, p99_val)
+            mx_clean = np.clip(mx, p01_val, p99_val)
 
-            df['salary_minimum_clean'] = df['salary_minimum'].clip(lower=p01_val, upper=p99_val)
-            df['salary_maximum_clean'] = df['salary_maximum'].clip(lower=p01_val, upper=p99_val)
-            df['average_salary_clean'] = (df['salary_minimum_clean'] + df['salary_maximum_clean']) / 2
+            df['salary_minimum_clean'] = mn_clean
+            df['salary_maximum_clean'] = mx_clean
+            df['average_salary_clean'] = (mn_clean + mx_clean) * 0.5
 
             print(f"[Silver]   Winsorized to [${p01_val:.0f}, ${p99_val:,.0f}]")
         else:
-            df['salary_minimum_clean'] = df['salary_minimum']
-            df['salary_maximum_clean'] = df['salary_maximum']
-            df['average_salary_clean'] = df['average_salary_temp']
+            df['salary_minimum_clean'] = mn
+            df['salary_maximum_clean'] = mx
+            df['average_salary_clean'] = avg
             print(f"[Silver]   No winsorization applied (no valid salaries)")
 
-        # Drop temp column
-        df = df.drop(columns=['average_salary_temp'])
-
         return df
 
     def _parse_dates(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -401,13 +560,16 @@ class SGJobsETL:
         Extract date-based features
 
         Creates:
-        - posting_month: YYYY-MM period
+        - posting_month: int32 YYYYMM (formatted to 'YYYY-MM' at the Gold stage)
         - posting_duration_days: Days between posting and expiry
         """
         print("[Silver] Parsing date features...")
 
-        # Extract posting month
-        df['posting_month'] = df['metadata_newPostingDate'].dt.to_period('M')
+        # Extract posting month as int32 YYYYMM — groups/hashes on the fast
+        # integer path and serializes smaller than the Period extension type
+        # (nullable Int32 keeps NaT rows as NA)
+        dt = df['metadata_newPostingDate'].dt
+        df['posting_month'] = (dt.year * 100 + dt.month).astype('Int32')
 
         # Calculate posting duration
         df['posting_duration_days'] = (
@@ -418,8 +580,8 @@ class SGJobsETL:
         print(f"[Silver]   Avg posting duration: {avg_duration:.1f} days")
 
         # Extract year and month for convenience
-        df['posting_year'] = df['metadata_newPostingDate'].dt.year
-        df['posting_month_num'] = df['metadata_newPostingDate'].dt.month
+        df['posting_year'] = dt.year
+        df['posting_month_num'] = dt.month
 
         return df
 
@@ -431,21 +593,32 @@ class SGJobsETL:
         """
         print("[Silver] Extracting role families from job titles...")
 
-        def classify_role(title: str) -> str:
-            if pd.isna(title):
-                return "Other"
+        if self.config['ROLE_KEYWORDS'] is config.ROLE_KEYWORDS:
+            # Fast path: lowercase the whole column in one Arrow kernel
+            # pass, classify each distinct title once via the compiled
+            # per-family patterns (config.ROLE_PATTERNS), then broadcast
+            # via map. Results persist to a sidecar cache so later runs
+            # only scan titles they haven't seen before.
+            title_lower = df['title'].astype('string[pyarrow]').str.lower()
+            roles = self._cached_role_map(title_lower)
+            df['role_family'] = title_lower.map(roles).fillna('Other')
+        else:
+            # Overridden keywords: keep the priority-ordered keyword loop
+            def classify_role(title: str) -> str:
+                if pd.isna(title):
+                    return "Other"
 
-            title_lower = title.lower()
+                title_lower = title.lower()
 
-            # Iterate in order (most specific first)
-            for role_family, keywords in self.config['ROLE_KEYWORDS'].items():
-                for keyword in keywords:
-                    if keyword in title_lower:
-                        return role_family
+                # Iterate in order (most specific first)
+                for role_family, keywords in self.config['ROLE_KEYWORDS'].items():
+                    for keyword in keywords:
+                        if keyword in title_lower:
+                            return role_family
 
-            return "Other"
+                return "Other"
 
-        df['role_family'] = df['title'].apply(classify_role)
+            df['role_family'] = df['title'].apply(classify_role)
 
         # Log distribution
         role_counts = df['role_family'].value_counts()
@@ -454,6 +627,45 @@ class SGJobsETL:
 
         return df
 
+    def _cached_role_map(self, title_lower: pd.Series) -> Dict[str, str]:
+        """
+        Map each distinct lowercased title to its role family
+
+        Backed by a sidecar parquet keyed on config.ROLE_KEYWORDS_VERSION:
+        editing the keyword table invalidates the whole cache, otherwise
+        only titles never seen before pay for a regex scan.
+        """
+        cache_path = self.config['PATHS'].get('role_cache')
+
+        roles: Dict[str, str] = {}
+        if cache_path and os.path.exists(cache_path):
+            try:
+                cached = pd.read_parquet(cache_path)
+                if (cached['keywords_version'] == config.ROLE_KEYWORDS_VERSION).all():
+                    roles = dict(zip(cached['title_lower'], cached['role_family']))
+            except (OSError, pa.ArrowInvalid, KeyError):
+                pass
+
+        new_titles = [t for t in pd.unique(title_lower.dropna())
+                      if t not in roles]
+        for title in new_titles:
+            roles[title] = config.match_role_lower(title) or 'Other'
+
+        if cache_path and new_titles:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                pd.DataFrame({
+                    'title_lower': list(roles.keys()),
+                    'role_family': list(roles.values()),
+                    'keywords_version': config.ROLE_KEYWORDS_VERSION,
+                }).to_parquet(cache_path, compression='zstd', index=False)
+                print(f"[Silver]   Role cache: {len(new_titles):,} new titles "
+                      f"({len(roles):,} cached)")
+            except OSError as e:
+                print(f"[Silver]   ⚠️  Could not write role cache: {e}")
+
+        return roles
+
     def _add_derived_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Add computed features for analysis
@@ -466,34 +678,51 @@ class SGJobsETL:
         """
         print("[Silver] Adding derived features...")
 
-        # Experience bands
-        def get_experience_band(years):
-            if pd.isna(years):
-                return 'Unknown'
-
-            # Cap at max
-            years = min(years, self.config['MAX_EXPERIENCE_YEARS'])
+        # Experience bands — single pd.cut pass (C-level searchsorted)
+        # instead of a per-row Python lookup
+        if (self.config['EXPERIENCE_BANDS'] is config.EXPERIENCE_BANDS
+                and self.config['MAX_EXPERIENCE_YEARS'] == config.MAX_EXPERIENCE_YEARS):
+            bands = config.assign_experience_band(df['minimumYearsExperience'])
+            df['experience_band'] = bands.cat.add_categories('Unknown').fillna('Unknown')
+        else:
+            # Overridden bands: keep the per-row lookup
+            def get_experience_band(years):
+                if pd.isna(years):
+                    return 'Unknown'
 
-            for min_yr, max_yr, label in self.config['EXPERIENCE_BANDS']:
-                if min_yr <= years <= max_yr:
-                    return label
+                # Cap at max
+                years = min(years, self.config['MAX_EXPERIENCE_YEARS'])
 
-            return 'Unknown'
+                for min_yr, max_yr, label in self.config['EXPERIENCE_BANDS']:
+                    if min_yr <= years <= max_yr:
+                        return label
 
-        df['experience_band'] = df['minimumYearsExperience'].apply(get_experience_band)
+                return 'Unknown'
 
-        # Competition ratio (applications per vacancy)
-        df['competition_ratio'] = df['metadata_totalNumberJobApplication'] / df['numberOfVacancies'].replace(0, np.nan)
+            df['experience_band'] = df['minimumYearsExperience'].apply(get_experience_band)
 
-        # Repost flag
-        df['is_reposted'] = df['metadata_repostCount'] > 0
+        # Competition ratio (applications per vacancy) — one masked divide,
+        # no intermediate zero→NaN column and no divide-by-zero warnings
+        apps = df['metadata_totalNumberJobApplication'].to_numpy(dtype='float64', na_value=np.nan)
+        vac = df['numberOfVacancies'].to_numpy(dtype='float64', na_value=np.nan)
+        ratio = np.full_like(apps, np.nan)
+        np.divide(apps, vac, out=ratio, where=vac > 0)
+        df['competition_ratio'] = ratio
 
-        # Annual salary
-        df['annual_salary_clean'] = (df['average_salary_clean'] * 12).astype('float32')
+        # Repost flag / annual salary — guarded so the helper also works on
+        # partial frames (as the unit tests exercise it)
+        if 'metadata_repostCount' in df.columns:
+            df['is_reposted'] = df['metadata_repostCount'] > 0
+        if 'average_salary_clean' in df.columns:
+            df['annual_salary_clean'] = (df['average_salary_clean'] * 12).astype('float32')
 
         print(f"[Silver]   Experience bands: {df['experience_band'].nunique()} unique")
         print(f"[Silver]   Avg competition ratio: {df['competition_ratio'].mean():.2f} applications/vacancy")
-        print(f"[Silver]   Reposted jobs: {df['is_reposted'].sum():,} ({df['is_reposted'].mean()*100:.1f}%)")
+        if 'is_reposted' in df.columns:
+            # na_value=False: metadata_repostCount is nullable Int64, so the
+            # flag can carry NA — a bare to_numpy().sum() would choke on it
+            n_reposted = int(df['is_reposted'].to_numpy(dtype=bool, na_value=False).sum())
+            print(f"[Silver]   Reposted jobs: {n_reposted:,} ({n_reposted / len(df) * 100:.1f}%)")
 
         return df
 
@@ -549,23 +778,34 @@ class SGJobsETL:
         df['posting_month_num']     = df['posting_month_num'].astype('uint8')
 
         # --- Convert low-cardinality strings to category ---
+        # The three classification columns are always tiny domains (≤17
+        # values, so int8 codes): force them categorical unconditionally so
+        # the Gold groupbys run on codes and the parquet stays dictionary-
+        # encoded, regardless of what the sample probe below concludes
+        for col in ['role_family', 'seniority_tier', 'experience_band']:
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
+
         category_candidates = [
-            'employmentTypes', 'seniority_tier', 'role_family', 'experience_band',
+            'employmentTypes',
             'primary_industry', 'positionLevels', 'status_jobStatus',
             'metadata_isPostedOnBehalf', 'postedCompany_name',
         ]
+        # Probe cardinality on a capped sample instead of a full nunique()
+        # per column — category only pays off when cardinality ≪ length, and
+        # a 50k-row sample answers that without hashing the whole column
         converted_count = 0
         for col in category_candidates:
             if col in df.columns:
-                unique_ratio = df[col].nunique() / len(df)
-                if unique_ratio < 0.5:
+                sample = df[col].iloc[:min(len(df), 50_000)]
+                if len(sample) > 0 and sample.nunique() / len(sample) < 0.5:
                     df[col] = df[col].astype('category')
                     converted_count += 1
 
-        # --- Convert boolean flags ---
+        # --- Convert boolean flags (NA → False, same as the summary count) ---
         for col in ['is_reposted', 'salary_outlier_iqr']:
             if col in df.columns:
-                df[col] = df[col].astype('bool')
+                df[col] = df[col].fillna(False).astype('bool')
 
         final_memory = df.memory_usage(deep=True).sum() / 1024**2
         savings = (1 - final_memory / initial_memory) * 100
@@ -582,7 +822,23 @@ class SGJobsETL:
         silver_path = self.config['PATHS']['silver']
         os.makedirs(os.path.dirname(silver_path), exist_ok=True)
 
-        df.to_parquet(silver_path, compression='snappy', index=False)
+        # industry_list lives in memory as an Arrow list array, but the
+        # ArrowDtype it would record in the file's pandas metadata cannot be
+        # reconstructed by pd.read_parquet (TypeError on every subsequent
+        # Silver read, even column-projected ones) — write plain object
+        # lists instead, which round-trip as a normal parquet list column
+        if 'industry_list' in df.columns and isinstance(df['industry_list'].dtype, pd.ArrowDtype):
+            df = df.assign(industry_list=pd.Series(
+                df['industry_list'].tolist(), index=df.index, dtype=object))
+
+        # Cluster rows by primary_industry so each row group's min/max
+        # statistics cover a narrow industry range — per-industry filtered
+        # reads (read_parquet(filters=...)) then skip most row groups
+        if 'primary_industry' in df.columns:
+            df = df.sort_values('primary_industry', ignore_index=True, kind='stable')
+
+        df.to_parquet(silver_path, **{**self._PARQUET_WRITE_OPTS,
+                                      'write_statistics': True})
 
         file_size = os.path.getsize(silver_path) / 1024**2
         print(f"[Silver]   Saved to: {silver_path}")
@@ -597,29 +853,67 @@ class SGJobsETL:
         Execute Gold layer pipeline: Enriched → Aggregated
 
         Returns:
-            Dict of DataFrames (all 6 Gold tables)
+            Dict of DataFrames (all 9 Gold tables)
         """
         print("\n" + "="*70)
         print("GOLD LAYER: Business Aggregates")
         print("="*70)
 
-        df = self.load_silver()
+        # Only read the columns the aggregators actually touch — the Silver
+        # file carries many more (titles, raw salary fields, dates)
+        df = self.load_silver(columns=self._GOLD_INPUT_COLS)
+
+        # Explode industries once — four aggregators share the inflated frame
+        df_exploded = self._explode_industries(df)
+
+        # The six base aggregations are independent — run them on a thread
+        # pool (groupby/quantile kernels release the GIL in NumPy/Arrow),
+        # then derive the two tables that depend on base results
+        jobs = [
+            ('agg_monthly_postings', self._agg_monthly_postings, df_exploded),
+            ('agg_salary_by_role', self._agg_salary_by_role, df),
+            ('agg_industry_demand', self._agg_industry_demand, df_exploded),
+            ('agg_competition', self._agg_competition, df_exploded),
+            ('agg_top_companies', self._agg_top_companies, df),
+            ('agg_experience_demand', self._agg_experience_demand, df_exploded),
+            ('agg_employment_type', self._agg_employment_type, df),
+        ]
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            futures = {name: pool.submit(fn, frame) for name, fn, frame in jobs}
+            gold_tables = {name: future.result() for name, future in futures.items()}
+
+        gold_tables['agg_monthly_index'] = self._agg_monthly_index(gold_tables['agg_monthly_postings'])
+        gold_tables['agg_experience_pivot'] = self._agg_experience_pivot(gold_tables['agg_experience_demand'])
 
-        gold_tables = {}
-        gold_tables['agg_monthly_postings'] = self._agg_monthly_postings(df)
-        gold_tables['agg_salary_by_role'] = self._agg_salary_by_role(df)
-        gold_tables['agg_industry_demand'] = self._agg_industry_demand(df)
-        gold_tables['agg_competition'] = self._agg_competition(df)
-        gold_tables['agg_top_companies'] = self._agg_top_companies(df)
-        gold_tables['agg_experience_demand'] = self._agg_experience_demand(df)
+        # The aggregates are orders of magnitude smaller than their inputs —
+        # drop the silver frame and its exploded copy before the write phase
+        # so peak memory is set by aggregation, not held through the saves
+        del df, df_exploded
 
         # Save all tables
         gold_path = self.config['PATHS']['gold']
         os.makedirs(gold_path, exist_ok=True)
 
-        for table_name, table_df in gold_tables.items():
+        for table_name, table_df in list(gold_tables.items()):
+            # Cluster rows on the table's primary query dimension so the
+            # row-group statistics actually prune for filtered readers
+            sort_keys = [c for c in self._GOLD_SORT_KEYS.get(table_name, [])
+                         if c in table_df.columns]
+            if sort_keys:
+                table_df = table_df.sort_values(sort_keys, ignore_index=True)
+                gold_tables[table_name] = table_df
+
             output_path = os.path.join(gold_path, f"{table_name}.parquet")
-            table_df.to_parquet(output_path, compression='snappy', index=False)
+            table_df.to_parquet(output_path, **{**self._PARQUET_WRITE_OPTS,
+                                                'row_group_size': 50_000,
+                                                'write_statistics': True})
+            # Feather v2 + LZ4 alongside parquet: near-zero-copy reads for
+            # the dashboard's cold cache misses
+            feather.write_feather(
+                table_df.reset_index(drop=True),
+                os.path.join(gold_path, f"{table_name}.feather"),
+                compression='lz4',
+            )
             print(f"[Gold]   Saved {table_name}: {len(table_df):,} rows")
 
         print(f"\n✅ Gold layer complete: {len(gold_tables)} tables")
@@ -627,19 +921,37 @@ class SGJobsETL:
 
         return gold_tables
 
-    def _agg_monthly_postings(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _explode_industries(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Explode industry_list into one row per (posting, industry)
+
+        Done once in run_gold (Q9 Decision) — the row-inflated frame is
+        shared by every industry-grain aggregator instead of each one
+        re-materializing it. Only the columns those aggregators touch are
+        carried through the explosion.
+        """
+        agg_cols = [
+            'posting_month', 'industry_list', 'employmentTypes',
+            'metadata_jobPostId', 'numberOfVacancies', 'average_salary_clean',
+            'metadata_totalNumberJobApplication', 'metadata_totalNumberOfView',
+            'is_reposted', 'competition_ratio', 'role_family',
+            'experience_band', 'seniority_tier',
+        ]
+        exploded = (
+            df[[c for c in agg_cols if c in df.columns]]
+            .explode('industry_list')
+            .rename(columns={'industry_list': 'industry'})
+        )
+        return exploded[exploded['industry'].notna()]
+
+    def _agg_monthly_postings(self, df_exploded: pd.DataFrame) -> pd.DataFrame:
         """
         Monthly posting trends by industry
 
-        Grain: posting_month × primary_industry
+        Grain: posting_month × industry (exploded)
         """
         print("[Gold] Generating agg_monthly_postings...")
 
-        # Explode industries (Q9 Decision)
-        df_exploded = df.explode('industry_list').copy()
-        df_exploded = df_exploded[df_exploded['industry_list'].notna()]
-        df_exploded = df_exploded.rename(columns={'industry_list': 'industry'})
-
         # Group by month and industry
         agg = df_exploded.groupby(['posting_month', 'industry']).agg({
             'metadata_jobPostId': 'count',
@@ -653,12 +965,18 @@ class SGJobsETL:
         emp_type_agg = df_exploded.groupby(['posting_month', 'industry', 'employmentTypes']).size().unstack(fill_value=0)
         emp_type_pct = emp_type_agg.div(emp_type_agg.sum(axis=1), axis=0)
 
-        # Merge employment type percentages
-        for col in emp_type_pct.columns:
-            col_name = f"pct_{col.lower().replace(' ', '_').replace('/', '_')}"
-            emp_type_pct_reset = emp_type_pct[[col]].reset_index()
-            emp_type_pct_reset.columns = ['posting_month', 'industry', col_name]
-            agg = agg.merge(emp_type_pct_reset, on=['posting_month', 'industry'], how='left')
+        # Merge all employment type percentages in one wide join instead of
+        # one hash join per column
+        emp_type_pct.columns = [
+            f"pct_{col.lower().replace(' ', '_').replace('/', '_')}"
+            for col in emp_type_pct.columns
+        ]
+        agg = agg.merge(emp_type_pct.reset_index(), on=['posting_month', 'industry'], how='left')
+
+        # Format the YYYYMM ints as 'YYYY-MM' only at the gold boundary —
+        # the dashboard expects the string form
+        ym = agg['posting_month'].astype('int64')
+        agg['posting_month'] = (ym // 100).astype(str) + '-' + (ym % 100).astype(str).str.zfill(2)
 
         return agg
 
@@ -671,20 +989,23 @@ class SGJobsETL:
         print("[Gold] Generating agg_salary_by_role...")
 
         # Filter rows with valid salary
-        df_salary = df[df['average_salary_clean'].notna()].copy()
+        df_salary = df[df['average_salary_clean'].notna()]
 
-        # Group by role, seniority, industry
-        agg = df_salary.groupby(['role_family', 'seniority_tier', 'primary_industry']).agg({
-            'average_salary_clean': ['count', 'mean', lambda x: x.quantile(0.25),
-                                     'median', lambda x: x.quantile(0.75)]
-        }).reset_index()
+        # Group by role, seniority, industry — named aggs plus a single
+        # Cython groupby-quantile call, no per-group Python lambdas
+        grp = df_salary.groupby(['role_family', 'seniority_tier', 'primary_industry'],
+                                observed=True)['average_salary_clean']
+        agg = grp.agg(n='count', salary_mean='mean', salary_median='median')
+        quantiles = grp.quantile([0.25, 0.75]).unstack()
+        agg['salary_p25'] = quantiles[0.25]
+        agg['salary_p75'] = quantiles[0.75]
 
-        agg.columns = ['role_family', 'seniority_tier', 'industry',
-                       'n', 'salary_mean', 'salary_p25', 'salary_median', 'salary_p75']
+        agg = agg.reset_index().rename(columns={'primary_industry': 'industry'})
 
-        return agg
+        return agg[['role_family', 'seniority_tier', 'industry',
+                    'n', 'salary_mean', 'salary_p25', 'salary_median', 'salary_p75']]
 
-    def _agg_industry_demand(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _agg_industry_demand(self, df_exploded: pd.DataFrame) -> pd.DataFrame:
         """
         Industry-level KPIs
 
@@ -692,11 +1013,6 @@ class SGJobsETL:
         """
         print("[Gold] Generating agg_industry_demand...")
 
-        # Explode industries
-        df_exploded = df.explode('industry_list').copy()
-        df_exploded = df_exploded[df_exploded['industry_list'].notna()]
-        df_exploded = df_exploded.rename(columns={'industry_list': 'industry'})
-
         # Aggregate by industry
         agg = df_exploded.groupby('industry').agg({
             'metadata_jobPostId': 'count',
@@ -712,7 +1028,7 @@ class SGJobsETL:
 
         return agg
 
-    def _agg_competition(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _agg_competition(self, df_exploded: pd.DataFrame) -> pd.DataFrame:
         """
         Competition metrics by industry and role
 
@@ -720,25 +1036,22 @@ class SGJobsETL:
         """
         print("[Gold] Generating agg_competition...")
 
-        # Explode industries
-        df_exploded = df.explode('industry_list').copy()
-        df_exploded = df_exploded[df_exploded['industry_list'].notna()]
-        df_exploded = df_exploded.rename(columns={'industry_list': 'industry'})
-
         # Filter rows with valid competition ratio
-        df_comp = df_exploded[df_exploded['competition_ratio'].notna()].copy()
-
-        # Aggregate by industry and role
-        agg = df_comp.groupby(['industry', 'role_family']).agg({
-            'metadata_jobPostId': 'count',
-            'metadata_totalNumberJobApplication': 'mean',
-            'competition_ratio': ['median', lambda x: x.quantile(0.25), lambda x: x.quantile(0.75)]
-        }).reset_index()
+        df_comp = df_exploded[df_exploded['competition_ratio'].notna()]
+
+        # Aggregate by industry and role — quantiles via one Cython
+        # groupby-quantile call instead of per-group Python lambdas
+        grp = df_comp.groupby(['industry', 'role_family'], observed=True)
+        agg = grp.agg(
+            posting_count=('metadata_jobPostId', 'count'),
+            avg_applications=('metadata_totalNumberJobApplication', 'mean'),
+            competition_ratio_median=('competition_ratio', 'median'),
+        )
+        quantiles = grp['competition_ratio'].quantile([0.25, 0.75]).unstack()
+        agg['competition_ratio_p25'] = quantiles[0.25]
+        agg['competition_ratio_p75'] = quantiles[0.75]
 
-        agg.columns = ['industry', 'role_family', 'posting_count', 'avg_applications',
-                       'competition_ratio_median', 'competition_ratio_p25', 'competition_ratio_p75']
-
-        return agg
+        return agg.reset_index()
 
     def _agg_top_companies(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -761,7 +1074,7 @@ class SGJobsETL:
 
         return agg
 
-    def _agg_experience_demand(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _agg_experience_demand(self, df_exploded: pd.DataFrame) -> pd.DataFrame:
         """
         Experience requirements by industry and seniority
 
@@ -769,11 +1082,6 @@ class SGJobsETL:
         """
         print("[Gold] Generating agg_experience_demand...")
 
-        # Explode industries
-        df_exploded = df.explode('industry_list').copy()
-        df_exploded = df_exploded[df_exploded['industry_list'].notna()]
-        df_exploded = df_exploded.rename(columns={'industry_list': 'industry'})
-
         # Aggregate
         agg = df_exploded.groupby(['industry', 'experience_band', 'seniority_tier']).agg({
             'metadata_jobPostId': 'count',
@@ -785,23 +1093,93 @@ class SGJobsETL:
 
         return agg
 
+    def _agg_employment_type(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Posting counts per employment type
+
+        Exact counts over all of Silver — the Home page pie previously
+        estimated this from a head() sample, which skews once Silver is
+        clustered by industry on disk.
+
+        Grain: employmentTypes (per posting, not exploded)
+        """
+        print("[Gold] Generating agg_employment_type...")
+
+        agg = (
+            df.groupby('employmentTypes', observed=True)
+            .size()
+            .reset_index(name='posting_count')
+        )
+        return agg.sort_values('posting_count', ascending=False, ignore_index=True)
+
+    def _agg_monthly_index(self, monthly: pd.DataFrame) -> pd.DataFrame:
+        """
+        Sector growth index precomputed from monthly postings
+
+        Each industry's posting volume indexed to its first month = 100,
+        so the dashboard filters instead of recomputing per interaction.
+
+        Grain: posting_month × industry
+        """
+        print("[Gold] Generating agg_monthly_index...")
+
+        idx = monthly[['posting_month', 'industry', 'posting_count']] \
+            .sort_values(['industry', 'posting_month'])
+        baseline = idx.groupby('industry', observed=True, sort=False)['posting_count'].transform('first')
+        idx['index'] = idx['posting_count'] / baseline.where(baseline > 0) * 100
+
+        return idx
+
+    def _agg_experience_pivot(self, exp_demand: pd.DataFrame) -> pd.DataFrame:
+        """
+        Wide industry × experience_band posting counts
+
+        Precomputed at ETL time so the dashboard heatmap only filters rows
+        instead of pivoting on every render.
+
+        Grain: industry (one column per experience band)
+        """
+        print("[Gold] Generating agg_experience_pivot...")
+
+        wide = (
+            exp_demand
+            .groupby(['industry', 'experience_band'], observed=True)['posting_count']
+            .sum()
+            .unstack('experience_band', fill_value=0)
+        )
+        wide.columns = wide.columns.astype(str)
+
+        return wide.reset_index()
+
     # ========================================================================
     # UTILITY METHODS
     # ========================================================================
 
-    def load_bronze(self) -> pd.DataFrame:
-        """Load Bronze layer data"""
+    def load_bronze(self, columns: Optional[list] = None) -> pd.DataFrame:
+        """
+        Load Bronze layer data
+
+        Args:
+            columns: Optional column subset — pushed down to the parquet
+                reader so untouched columns are never decoded
+        """
         bronze_path = self.config['PATHS']['bronze']
         if not os.path.exists(bronze_path):
             raise FileNotFoundError(f"Bronze data not found. Run run_bronze() first.")
-        return pd.read_parquet(bronze_path)
+        return pd.read_parquet(bronze_path, columns=columns)
+
+    def load_silver(self, columns: Optional[list] = None) -> pd.DataFrame:
+        """
+        Load Silver layer data
 
-    def load_silver(self) -> pd.DataFrame:
-        """Load Silver layer data"""
+        Args:
+            columns: Optional column subset — pushed down to the parquet
+                reader so untouched columns are never decoded
+        """
         silver_path = self.config['PATHS']['silver']
         if not os.path.exists(silver_path):
             raise FileNotFoundError(f"Silver data not found. Run run_silver() first.")
-        return pd.read_parquet(silver_path)
+        return pd.read_parquet(silver_path, columns=columns)
 
     def load_gold(self, table: str) -> pd.DataFrame:
         """
@@ -827,23 +1205,28 @@ class SGJobsETL:
             'gold': {},
         }
 
-        # Count rows in each layer
+        # Count rows in each layer from parquet footers — O(1) per file
+        # instead of deserializing every column page
         bronze_path = self.config['PATHS']['bronze']
         if os.path.exists(bronze_path):
-            summary['bronze'] = len(pd.read_parquet(bronze_path))
+            summary['bronze'] = _stat_num_rows(bronze_path)
 
         silver_path = self.config['PATHS']['silver']
         if os.path.exists(silver_path):
-            summary['silver'] = len(pd.read_parquet(silver_path))
+            summary['silver'] = _stat_num_rows(silver_path)
 
-        # Count Gold tables
+        # Count Gold tables — footer reads are tiny I/O operations, so a
+        # thread pool overlaps them across files; os.scandir hands back
+        # paths without extra stat/join calls
         gold_dir = self.config['PATHS']['gold']
         if os.path.exists(gold_dir):
-            for file in os.listdir(gold_dir):
-                if file.endswith('.parquet'):
-                    table_name = file.replace('.parquet', '')
-                    table_path = os.path.join(gold_dir, file)
-                    summary['gold'][table_name] = len(pd.read_parquet(table_path))
+            with os.scandir(gold_dir) as entries:
+                gold_files = [(e.name[:-len('.parquet')], e.path)
+                              for e in entries if e.name.endswith('.parquet')]
+            if gold_files:
+                with ThreadPoolExecutor(max_workers=min(32, len(gold_files))) as pool:
+                    counts = pool.map(_stat_num_rows, [p for _, p in gold_files])
+                summary['gold'] = dict(zip([name for name, _ in gold_files], counts))
 
         # Data quality checks
         print("\n" + "="*70)
@@ -5,6 +5,7 @@ Pytest fixtures for SGJobsETL testing
 import pytest
 import pandas as pd
 import numpy as np
+from src.etl import config
 from src.etl.sg_jobs_etl import SGJobsETL
 
 
@@ -30,9 +31,11 @@ def sample_raw_data():
 
 
 @pytest.fixture
-def etl_instance():
-    """ETL instance for testing"""
-    return SGJobsETL()
+def etl_instance(tmp_path):
+    """ETL instance for testing — sidecar caches land in tmp, not the repo"""
+    return SGJobsETL(config_override={
+        'PATHS': {**config.PATHS, 'role_cache': str(tmp_path / 'role_family.parquet')},
+    })
 
 
 @pytest.fixture